@@ -2,6 +2,7 @@
 
 import datetime
 import logging
+import sys
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Sequence, Union
 
@@ -17,12 +18,34 @@ from pydicom._storage_sopclass_uids import (
 from highdicom.base import SOPClass
 from highdicom.sr.coding import CodedConcept
 from highdicom.sr.enum import ValueTypeValues
-from highdicom.sr.utils import find_content_items
+from highdicom.sr.utils import iter_content_items
 
 
 logger = logging.getLogger(__name__)
 
 
+def _contains_scoord3d_items(content: Dataset) -> bool:
+    """Checks whether the content tree contains SCOORD3D content items.
+
+    Parameters
+    ----------
+    content: pydicom.dataset.Dataset
+        Root container content item
+
+    Returns
+    -------
+    bool
+        whether any content item of the tree has value type SCOORD3D
+
+    """
+    matches = iter_content_items(
+        content,
+        value_type=ValueTypeValues.SCOORD3D,
+        recursive=True
+    )
+    return any(True for _ in matches)
+
+
 class _SR(SOPClass):
 
     """Abstract base class for Structured Report (SR) SOP classes."""
@@ -116,8 +139,9 @@ class _SR(SOPClass):
         Each dataset in `evidence` must be part of the same study.
 
         """
+        study_instance_uid = evidence[0].StudyInstanceUID
         super().__init__(
-            study_instance_uid=evidence[0].StudyInstanceUID,
+            study_instance_uid=study_instance_uid,
             series_instance_uid=series_instance_uid,
             series_number=series_number,
             sop_instance_uid=sop_instance_uid,
@@ -173,29 +197,29 @@ class _SR(SOPClass):
             self.PreliminaryFlag = 'PRELIMINARY'
 
         # Add content to dataset
-        for tag, value in content.items():
-            self[tag] = value
+        for elem in content.elements():
+            self[elem.tag] = elem
 
         evd_collection: Dict[str, List[Dataset]] = defaultdict(list)
         for evd in evidence:
-            if evd.StudyInstanceUID != evidence[0].StudyInstanceUID:
+            if evd.StudyInstanceUID != study_instance_uid:
                 raise ValueError(
                     'Referenced data sets must all belong to the same study.'
                 )
             evd_instance_item = Dataset()
             evd_instance_item.ReferencedSOPClassUID = evd.SOPClassUID
             evd_instance_item.ReferencedSOPInstanceUID = evd.SOPInstanceUID
-            evd_collection[evd.SeriesInstanceUID].append(
-                evd_instance_item
-            )
+            evd_series_uid = sys.intern(str(evd.SeriesInstanceUID))
+            evd_collection[evd_series_uid].append(evd_instance_item)
         evd_study_item = Dataset()
-        evd_study_item.StudyInstanceUID = evidence[0].StudyInstanceUID
-        evd_study_item.ReferencedSeriesSequence = []
+        evd_study_item.StudyInstanceUID = study_instance_uid
+        evd_series_items = []
         for evd_series_uid, evd_instance_items in evd_collection.items():
             evd_series_item = Dataset()
             evd_series_item.SeriesInstanceUID = evd_series_uid
             evd_series_item.ReferencedSOPSequence = evd_instance_items
-            evd_study_item.ReferencedSeriesSequence.append(evd_series_item)
+            evd_series_items.append(evd_series_item)
+        evd_study_item.ReferencedSeriesSequence = evd_series_items
         if requested_procedures is not None:
             self.ReferencedRequestSequence = requested_procedures
             self.CurrentRequestedProcedureEvidenceSequence = [evd_study_item]
@@ -206,7 +230,7 @@ class _SR(SOPClass):
         if previous_versions is not None:
             pre_collection: Dict[str, List[Dataset]] = defaultdict(list)
             for pre in previous_versions:
-                if pre.StudyInstanceUID != evidence[0].StudyInstanceUID:
+                if pre.StudyInstanceUID != study_instance_uid:
                     raise ValueError(
                         'Previous version data sets must belong to the '
                         'same study.'
@@ -214,23 +238,25 @@ class _SR(SOPClass):
                 pre_instance_item = Dataset()
                 pre_instance_item.ReferencedSOPClassUID = pre.SOPClassUID
                 pre_instance_item.ReferencedSOPInstanceUID = pre.SOPInstanceUID
-                pre_collection[pre.SeriesInstanceUID].append(
-                    pre_instance_item
-                )
+                pre_series_uid = sys.intern(str(pre.SeriesInstanceUID))
+                pre_collection[pre_series_uid].append(pre_instance_item)
             pre_study_item = Dataset()
-            pre_study_item.StudyInstanceUID = pre.StudyInstanceUID
-            pre_study_item.ReferencedSeriesSequence = []
+            pre_study_item.StudyInstanceUID = study_instance_uid
+            pre_series_items = []
             for pre_series_uid, pre_instance_items in pre_collection.items():
                 pre_series_item = Dataset()
                 pre_series_item.SeriesInstanceUID = pre_series_uid
                 pre_series_item.ReferencedSOPSequence = pre_instance_items
-                pre_study_item.ReferencedSeriesSequence.append(pre_series_item)
+                pre_series_items.append(pre_series_item)
+            pre_study_item.ReferencedSeriesSequence = pre_series_items
             self.PredecessorDocumentsSequence = [pre_study_item]
 
-        if performed_procedure_codes is not None:
-            self.PerformedProcedureCodeSequence = performed_procedure_codes
-        else:
-            self.PerformedProcedureCodeSequence = []
+        if performed_procedure_codes is None:
+            performed_procedure_codes = []
+        self.PerformedProcedureCodeSequence = [
+            CodedConcept(*code) if isinstance(code, Code) else code
+            for code in performed_procedure_codes
+        ]
 
         # TODO
         self.ReferencedPerformedProcedureStepSequence: List[Dataset] = []
@@ -333,6 +359,11 @@ class EnhancedSR(_SR):
         Each dataset in `evidence` must be part of the same study.
 
         """
+        if _contains_scoord3d_items(content):
+            raise ValueError(
+                'Enhanced SR does not support content items with '
+                'SCOORD3D value type.'
+            )
         super().__init__(
             evidence=evidence,
             content=content,
@@ -355,16 +386,6 @@ class EnhancedSR(_SR):
             record_evidence=record_evidence,
             **kwargs
         )
-        unsopported_content = find_content_items(
-            content,
-            value_type=ValueTypeValues.SCOORD3D,
-            recursive=True
-        )
-        if len(unsopported_content) > 0:
-            raise ValueError(
-                'Enhanced SR does not support content items with '
-                'SCOORD3D value type.'
-            )
 
 
 class ComprehensiveSR(_SR):
@@ -461,6 +482,11 @@ class ComprehensiveSR(_SR):
         Each dataset in `evidence` must be part of the same study.
 
         """
+        if _contains_scoord3d_items(content):
+            raise ValueError(
+                'Comprehensive SR does not support content items with '
+                'SCOORD3D value type.'
+            )
         super().__init__(
             evidence=evidence,
             content=content,
@@ -483,16 +509,6 @@ class ComprehensiveSR(_SR):
             record_evidence=record_evidence,
             **kwargs
         )
-        unsopported_content = find_content_items(
-            content,
-            value_type=ValueTypeValues.SCOORD3D,
-            recursive=True
-        )
-        if len(unsopported_content) > 0:
-            raise ValueError(
-                'Comprehensive SR does not support content items with '
-                'SCOORD3D value type.'
-            )
 
 
 class Comprehensive3DSR(_SR):
@@ -1,5 +1,6 @@
 """DICOM structured reporting templates."""
-from typing import Optional, Sequence, Union
+import itertools
+from typing import List, Optional, Sequence, Tuple, Union
 
 from pydicom.sr.coding import Code
 from pydicom.sr.codedict import codes
@@ -35,6 +36,103 @@ DEFAULT_LANGUAGE = CodedConcept(
     meaning='English (United States)'
 )
 
+_ALGORITHM_NAME = Code('111001', 'DCM', 'Algorithm Name')
+_ALGORITHM_VERSION = Code('111003', 'DCM', 'Algorithm Version')
+_ALGORITHM_PARAMETER = Code('111002', 'DCM', 'Algorithm Parameter')
+_TRACKING_IDENTIFIER = Code('112039', 'DCM', 'Tracking Identifier')
+_TRACKING_UNIQUE_IDENTIFIER = Code(
+    '112040', 'DCM', 'Tracking Unique Identifier'
+)
+_TIME_POINT = Code('C2348792', 'UMLS', 'Time Point')
+_TIME_POINT_TYPE = Code('126072', 'DCM', 'Time Point Type')
+_TIME_POINT_ORDER = Code('126073', 'DCM', 'Time Point Order')
+_SUBJECT_TIME_POINT_IDENTIFIER = Code(
+    '126070', 'DCM', 'Subject Time Point Identifier'
+)
+_PROTOCOL_TIME_POINT_IDENTIFIER = Code(
+    '126071', 'DCM', 'Protocol Time Point Identifier'
+)
+_UNIT_DIMENSIONLESS = Code('1', 'UCUM', 'no units')
+_POPULATION_DESCRIPTION = Code('121405', 'DCM', 'Population Description')
+_REFERENCE_AUTHORITY = Code('121406', 'DCM', 'Reference Authority')
+_NORMALITY = Code('121402', 'DCM', 'Normality')
+_LEVEL_OF_SIGNIFICANCE = Code('121403', 'DCM', 'Level of Significance')
+_SELECTION_STATUS = Code('121404', 'DCM', 'Selection Status')
+_UPPER_MEASUREMENT_UNCERTAINTY = Code(
+    '371886008', 'SCT', '+, range of upper measurement uncertainty'
+)
+_LOWER_MEASUREMENT_UNCERTAINTY = Code(
+    '371885007', 'SCT', '-, range of lower measurement uncertainty'
+)
+_NORMAL_RANGE_DESCRIPTION = codes.DCM.NormalRangeDescription
+_NORMAL_RANGE_AUTHORITY = codes.DCM.NormalRangeAuthority
+_DEVICE_OBSERVER_PHYSICAL_LOCATION = \
+    codes.DCM.DeviceObserverPhysicalLocationDuringObservation
+_DEVICE_ROLE_IN_PROCEDURE = codes.DCM.DeviceRoleInProcedure
+_DEVICE_SUBJECT_NAME = codes.DCM.DeviceSubjectName
+_DEVICE_SUBJECT_UID = codes.DCM.DeviceSubjectUID
+_DEVICE_SUBJECT_PHYSICAL_LOCATION = \
+    codes.DCM.DeviceSubjectPhysicalLocationDuringObservation
+_IMAGING_MEASUREMENT_REPORT = codes.cid7021.ImagingMeasurementReport
+_PERSON_OBSERVER_NAME = Code('121008', 'DCM', 'Person Observer Name')
+_PERSON_OBSERVER_LOGIN_NAME = Code(
+    '128774', 'DCM', 'Person Observer\'s Login Name'
+)
+_PERSON_OBSERVER_ORGANIZATION_NAME = Code(
+    '121009', 'DCM', 'Person Observer\'s Organization Name'
+)
+_PERSON_OBSERVER_ROLE_IN_ORGANIZATION = Code(
+    '121010', 'DCM', 'Person Observer\'s Role in the Organization'
+)
+_PERSON_OBSERVER_ROLE_IN_PROCEDURE = Code(
+    '121011', 'DCM', 'Person Observer\'s Role in this Procedure'
+)
+_DEVICE_OBSERVER_UID = Code('121012', 'DCM', 'Device Observer UID')
+_DEVICE_OBSERVER_NAME = Code('121013', 'DCM', 'Device Observer Name')
+_DEVICE_OBSERVER_MANUFACTURER = Code(
+    '121014', 'DCM', 'Device Observer Manufacturer'
+)
+_DEVICE_OBSERVER_MODEL_NAME = Code(
+    '121015', 'DCM', 'Device Observer Model Name'
+)
+_DEVICE_OBSERVER_SERIAL_NUMBER = Code(
+    '121016', 'DCM', 'Device Observer Serial Number'
+)
+_OBSERVER_TYPE = Code('121005', 'DCM', 'Observer Type')
+_SUBJECT_ID = Code('121030', 'DCM', 'Subject ID')
+_SPECIMEN_UID = Code('121039', 'DCM', 'Specimen UID')
+_SPECIMEN_IDENTIFIER = Code('121041', 'DCM', 'Specimen Identifier')
+_SPECIMEN_CONTAINER_IDENTIFIER = Code(
+    '111700', 'DCM', 'Specimen Container Identifier'
+)
+_SPECIMEN_TYPE = Code('121042', 'DCM', 'Specimen Type')
+_DEVICE_SUBJECT_MANUFACTURER = Code(
+    '121194', 'DCM', 'Device Subject Manufacturer'
+)
+_DEVICE_SUBJECT_MODEL_NAME = Code('121195', 'DCM', 'Device Subject Model Name')
+_DEVICE_SUBJECT_SERIAL_NUMBER = Code(
+    '121196', 'DCM', 'Device Subject Serial Number'
+)
+_SUBJECT_CLASS = Code('121024', 'DCM', 'Subject Class')
+_LANGUAGE_OF_CONTENT = Code(
+    '121049', 'DCM', 'Language of Content Item and Descendants'
+)
+_MEASUREMENT_METHOD = Code('370129005', 'SCT', 'Measurement Method')
+_DERIVATION = Code('121401', 'DCM', 'Derivation')
+_MEASUREMENT_GROUP = Code('125007', 'DCM', 'Measurement Group')
+_ACTIVITY_SESSION = Code('C67447', 'NCIt', 'Activity Session')
+_FINDING = Code('121071', 'DCM', 'Finding')
+_GEOMETRIC_PURPOSE_OF_REGION = Code(
+    '130400', 'DCM', 'Geometric purpose of region'
+)
+_PROCEDURE_REPORTED = Code('121058', 'DCM', 'Procedure reported')
+_IMAGING_MEASUREMENTS = Code('126010', 'DCM', 'Imaging Measurements')
+_DERIVED_IMAGING_MEASUREMENTS = Code(
+    '126011', 'DCM', 'Derived Imaging Measurements'
+)
+_IMAGE_LIBRARY = Code('111028', 'DCM', 'Image Library')
+_HAS_OBS_CONTEXT = RelationshipTypeValues.HAS_OBS_CONTEXT
+
 
 class Template(ContentSequence):
 
@@ -76,37 +174,26 @@ class AlgorithmIdentification(Template):
         """
         super().__init__()
         name_item = TextContentItem(
-            name=CodedConcept(
-                value='111001',
-                meaning='Algorithm Name',
-                scheme_designator='DCM'
-            ),
+            name=_ALGORITHM_NAME,
             value=name,
             relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
         )
         self.append(name_item)
         version_item = TextContentItem(
-            name=CodedConcept(
-                value='111003',
-                meaning='Algorithm Version',
-                scheme_designator='DCM'
-            ),
+            name=_ALGORITHM_VERSION,
             value=version,
             relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
         )
         self.append(version_item)
         if parameters is not None:
-            for param in parameters:
-                parameter_item = TextContentItem(
-                    name=CodedConcept(
-                        value='111002',
-                        meaning='Algorithm Parameter',
-                        scheme_designator='DCM'
-                    ),
+            self.extend([
+                TextContentItem(
+                    name=_ALGORITHM_PARAMETER,
                     value=param,
                     relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
                 )
-                self.append(parameter_item)
+                for param in parameters
+            ])
 
 
 class TrackingIdentifier(Template):
@@ -129,29 +216,23 @@ class TrackingIdentifier(Template):
 
         """
         super().__init__()
+        content: List[ContentItem] = []
         if uid is None:
             uid = UID()
         if identifier is not None:
             tracking_identifier_item = TextContentItem(
-                name=CodedConcept(
-                    value='112039',
-                    meaning='Tracking Identifier',
-                    scheme_designator='DCM'
-                ),
+                name=_TRACKING_IDENTIFIER,
                 value=identifier,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(tracking_identifier_item)
+            content.append(tracking_identifier_item)
         tracking_uid_item = UIDRefContentItem(
-            name=CodedConcept(
-                value='112040',
-                meaning='Tracking Unique Identifier',
-                scheme_designator='DCM'
-            ),
+            name=_TRACKING_UNIQUE_IDENTIFIER,
             value=uid,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(tracking_uid_item)
+        content.append(tracking_uid_item)
+        self.extend(content)
 
 
 class TimePointContext(Template):
@@ -163,9 +244,7 @@ class TimePointContext(Template):
         time_point: str,
         time_point_type: Optional[Union[CodedConcept, Code]] = None,
         time_point_order: Optional[int] = None,
-        subject_time_point_identifier: Optional[
-            LongitudinalTemporalOffsetFromEvent
-        ] = None,
+        subject_time_point_identifier: Optional[str] = None,
         protocol_time_point_identifier: Optional[str] = None,
         temporal_offset_from_event: Optional[
             LongitudinalTemporalOffsetFromEvent
@@ -202,60 +281,43 @@ class TimePointContext(Template):
             (required if `temporal_offset_from_event` is provided)
 
         """  # noqa
+        super().__init__()
+        content: List[ContentItem] = []
         time_point_item = TextContentItem(
-            name=CodedConcept(
-                value='C2348792',
-                meaning='Time Point',
-                scheme_designator='UMLS'
-            ),
+            name=_TIME_POINT,
             value=time_point,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(time_point_item)
+        content.append(time_point_item)
         if time_point_type is not None:
             time_point_type_item = CodeContentItem(
-                name=CodedConcept(
-                    value='126072',
-                    meaning='Time Point Type',
-                    scheme_designator='DCM'
-                ),
+                name=_TIME_POINT_TYPE,
                 value=time_point_type,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(time_point_type_item)
+            content.append(time_point_type_item)
         if time_point_order is not None:
             time_point_order_item = NumContentItem(
-                name=CodedConcept(
-                    value='126073',
-                    meaning='Time Point Order',
-                    scheme_designator='DCM'
-                ),
+                name=_TIME_POINT_ORDER,
                 value=time_point_order,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                unit=_UNIT_DIMENSIONLESS,
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(time_point_order_item)
+            content.append(time_point_order_item)
         if subject_time_point_identifier is not None:
-            subject_time_point_identifier_item = NumContentItem(
-                name=CodedConcept(
-                    value='126070',
-                    meaning='Subject Time Point Identifier',
-                    scheme_designator='DCM'
-                ),
+            subject_time_point_identifier_item = TextContentItem(
+                name=_SUBJECT_TIME_POINT_IDENTIFIER,
                 value=subject_time_point_identifier,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(subject_time_point_identifier_item)
+            content.append(subject_time_point_identifier_item)
         if protocol_time_point_identifier is not None:
             protocol_time_point_identifier_item = TextContentItem(
-                name=CodedConcept(
-                    value='126071',
-                    meaning='Protocol Time Point Identifier',
-                    scheme_designator='DCM'
-                ),
+                name=_PROTOCOL_TIME_POINT_IDENTIFIER,
                 value=protocol_time_point_identifier,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(protocol_time_point_identifier_item)
+            content.append(protocol_time_point_identifier_item)
         if temporal_offset_from_event is not None:
             if not isinstance(temporal_offset_from_event,
                               LongitudinalTemporalOffsetFromEvent):
@@ -263,7 +325,8 @@ class TimePointContext(Template):
                     'Argument "temporal_offset_from_event" must have type '
                     'LongitudinalTemporalOffsetFromEvent.'
                 )
-            self.append(temporal_offset_from_event)
+            content.append(temporal_offset_from_event)
+        self.extend(content)
 
 
 class MeasurementStatisticalProperties(Template):
@@ -297,35 +360,26 @@ class MeasurementStatisticalProperties(Template):
         super().__init__()
         if not isinstance(values, (list, tuple)):
             raise TypeError('Argument "values" must be a list.')
-        for concept in values:
-            if not isinstance(concept, NumContentItem):
-                raise ValueError(
-                    'Items of argument "values" must have type '
-                    'NumContentItem.'
-                )
-        self.extend(values)
+        if not all(isinstance(v, NumContentItem) for v in values):
+            raise ValueError(
+                'Items of argument "values" must have type NumContentItem.'
+            )
+        content: List[ContentItem] = list(values)
         if description is not None:
             description_item = TextContentItem(
-                name=CodedConcept(
-                    value='121405',
-                    meaning='Population Description',
-                    scheme_designator='DCM'
-                ),
+                name=_POPULATION_DESCRIPTION,
                 value=description,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(description_item)
+            content.append(description_item)
         if authority is not None:
             authority_item = TextContentItem(
-                name=CodedConcept(
-                    value='121406',
-                    meaning='Reference Authority',
-                    scheme_designator='DCM'
-                ),
+                name=_REFERENCE_AUTHORITY,
                 value=authority,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(authority_item)
+            content.append(authority_item)
+        self.extend(content)
 
 
 class NormalRangeProperties(Template):
@@ -356,27 +410,26 @@ class NormalRangeProperties(Template):
         super().__init__()
         if not isinstance(values, (list, tuple)):
             raise TypeError('Argument "values" must be a list.')
-        for concept in values:
-            if not isinstance(concept, NumContentItem):
-                raise ValueError(
-                    'Items of argument "values" must have type '
-                    'NumContentItem.'
-                )
-        self.extend(values)
+        if not all(isinstance(v, NumContentItem) for v in values):
+            raise ValueError(
+                'Items of argument "values" must have type NumContentItem.'
+            )
+        content: List[ContentItem] = list(values)
         if description is not None:
             description_item = TextContentItem(
-                name=codes.DCM.NormalRangeDescription,
+                name=_NORMAL_RANGE_DESCRIPTION,
                 value=description,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(description_item)
+            content.append(description_item)
         if authority is not None:
             authority_item = TextContentItem(
-                name=codes.DCM.NormalRangeAuthority,
+                name=_NORMAL_RANGE_AUTHORITY,
                 value=authority,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(authority_item)
+            content.append(authority_item)
+        self.extend(content)
 
 
 class MeasurementProperties(Template):
@@ -425,17 +478,14 @@ class MeasurementProperties(Template):
 
         """  # noqa
         super().__init__()
+        content: List[ContentItem] = []
         if normality is not None:
             normality_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121402',
-                    meaning='Normality',
-                    scheme_designator='DCM'
-                ),
+                name=_NORMALITY,
                 value=normality,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(normality_item)
+            content.append(normality_item)
         if measurement_statistical_properties is not None:
             if not isinstance(measurement_statistical_properties,
                               MeasurementStatisticalProperties):
@@ -443,7 +493,7 @@ class MeasurementProperties(Template):
                     'Argument "measurment_statistical_properties" must have '
                     'type MeasurementStatisticalProperties.'
                 )
-            self.extend(measurement_statistical_properties)
+            content.extend(measurement_statistical_properties)
         if normal_range_properties is not None:
             if not isinstance(normal_range_properties,
                               NormalRangeProperties):
@@ -451,51 +501,36 @@ class MeasurementProperties(Template):
                     'Argument "normal_range_properties" must have '
                     'type NormalRangeProperties.'
                 )
-            self.extend(normal_range_properties)
+            content.extend(normal_range_properties)
         if level_of_significance is not None:
             level_of_significance_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121403',
-                    meaning='Level of Significance',
-                    scheme_designator='DCM'
-                ),
+                name=_LEVEL_OF_SIGNIFICANCE,
                 value=level_of_significance,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(level_of_significance_item)
+            content.append(level_of_significance_item)
         if selection_status is not None:
             selection_status_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121404',
-                    meaning='Selection Status',
-                    scheme_designator='DCM'
-                ),
+                name=_SELECTION_STATUS,
                 value=selection_status,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(selection_status_item)
+            content.append(selection_status_item)
         if upper_measurement_uncertainty is not None:
             upper_measurement_uncertainty_item = CodeContentItem(
-                name=CodedConcept(
-                    value='371886008',
-                    meaning='+, range of upper measurement uncertainty',
-                    scheme_designator='SCT'
-                ),
+                name=_UPPER_MEASUREMENT_UNCERTAINTY,
                 value=upper_measurement_uncertainty,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(upper_measurement_uncertainty_item)
+            content.append(upper_measurement_uncertainty_item)
         if lower_measurement_uncertainty is not None:
             lower_measurement_uncertainty_item = CodeContentItem(
-                name=CodedConcept(
-                    value='371885007',
-                    meaning='-, range of lower measurement uncertainty',
-                    scheme_designator='SCT'
-                ),
+                name=_LOWER_MEASUREMENT_UNCERTAINTY,
                 value=lower_measurement_uncertainty,
                 relationship_type=RelationshipTypeValues.HAS_PROPERTIES
             )
-            self.append(lower_measurement_uncertainty_item)
+            content.append(lower_measurement_uncertainty_item)
+        self.extend(content)
 
 
 class PersonObserverIdentifyingAttributes(Template):
@@ -527,60 +562,42 @@ class PersonObserverIdentifyingAttributes(Template):
 
         """  # noqa
         super().__init__()
+        content: List[ContentItem] = []
         name_item = TextContentItem(
-            name=CodedConcept(
-                value='121008',
-                meaning='Person Observer Name',
-                scheme_designator='DCM',
-            ),
+            name=_PERSON_OBSERVER_NAME,
             value=name,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(name_item)
+        content.append(name_item)
         if login_name is not None:
             login_name_item = TextContentItem(
-                name=CodedConcept(
-                    value='128774',
-                    meaning='Person Observer\'s Login Name',
-                    scheme_designator='DCM',
-                ),
+                name=_PERSON_OBSERVER_LOGIN_NAME,
                 value=login_name,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(login_name_item)
+            content.append(login_name_item)
         if organization_name is not None:
             organization_name_item = TextContentItem(
-                name=CodedConcept(
-                    value='121009',
-                    meaning='Person Observer\'s Organization Name',
-                    scheme_designator='DCM',
-                ),
+                name=_PERSON_OBSERVER_ORGANIZATION_NAME,
                 value=organization_name,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(organization_name_item)
+            content.append(organization_name_item)
         if role_in_organization is not None:
             role_in_organization_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121010',
-                    meaning='Person Observer\'s Role in the Organization',
-                    scheme_designator='DCM',
-                ),
+                name=_PERSON_OBSERVER_ROLE_IN_ORGANIZATION,
                 value=role_in_organization,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(role_in_organization_item)
+            content.append(role_in_organization_item)
         if role_in_procedure is not None:
             role_in_procedure_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121011',
-                    meaning='Person Observer\'s Role in this Procedure',
-                    scheme_designator='DCM',
-                ),
+                name=_PERSON_OBSERVER_ROLE_IN_PROCEDURE,
                 value=role_in_procedure,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(role_in_procedure_item)
+            content.append(role_in_procedure_item)
+        self.extend(content)
 
 
 class DeviceObserverIdentifyingAttributes(Template):
@@ -618,69 +635,71 @@ class DeviceObserverIdentifyingAttributes(Template):
 
         """
         super().__init__()
+        content: List[ContentItem] = []
         device_observer_item = UIDRefContentItem(
-            name=CodedConcept(
-                value='121012',
-                meaning='Device Observer UID',
-                scheme_designator='DCM',
-            ),
+            name=_DEVICE_OBSERVER_UID,
             value=uid,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(device_observer_item)
+        content.append(device_observer_item)
+        if name is not None:
+            name_item = TextContentItem(
+                name=_DEVICE_OBSERVER_NAME,
+                value=name,
+                relationship_type=_HAS_OBS_CONTEXT
+            )
+            content.append(name_item)
         if manufacturer_name is not None:
             manufacturer_name_item = TextContentItem(
-                name=CodedConcept(
-                    value='121013',
-                    meaning='Device Observer Manufacturer',
-                    scheme_designator='DCM',
-                ),
+                name=_DEVICE_OBSERVER_MANUFACTURER,
                 value=manufacturer_name,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(manufacturer_name_item)
+            content.append(manufacturer_name_item)
         if model_name is not None:
             model_name_item = TextContentItem(
-                name=CodedConcept(
-                    value='121015',
-                    meaning='Device Observer Model Name',
-                    scheme_designator='DCM',
-                ),
+                name=_DEVICE_OBSERVER_MODEL_NAME,
                 value=model_name,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(model_name_item)
+            content.append(model_name_item)
         if serial_number is not None:
             serial_number_item = TextContentItem(
-                name=CodedConcept(
-                    value='121016',
-                    meaning='Device Observer Serial Number',
-                    scheme_designator='DCM',
-                ),
+                name=_DEVICE_OBSERVER_SERIAL_NUMBER,
                 value=serial_number,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(serial_number_item)
+            content.append(serial_number_item)
         if physical_location is not None:
             physical_location_item = TextContentItem(
-                name=codes.DCM.DeviceObserverPhysicalLocationDuringObservation,
+                name=_DEVICE_OBSERVER_PHYSICAL_LOCATION,
                 value=physical_location,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(physical_location_item)
+            content.append(physical_location_item)
         if role_in_procedure is not None:
             role_in_procedure_item = CodeContentItem(
-                name=codes.DCM.DeviceRoleInProcedure,
+                name=_DEVICE_ROLE_IN_PROCEDURE,
                 value=role_in_procedure,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(role_in_procedure_item)
+            content.append(role_in_procedure_item)
+        self.extend(content)
 
 
 class ObserverContext(Template):
 
     """TID 1002 Observer Context"""
 
+    # Expected type of identifying attributes keyed by observer type
+    _IDENTIFYING_ATTRIBUTES_TYPES = {
+        (code.value, code.scheme_designator): attributes_type
+        for code, attributes_type in (
+            (codes.cid270.Person, PersonObserverIdentifyingAttributes),
+            (codes.cid270.Device, DeviceObserverIdentifyingAttributes),
+        )
+    }
+
     def __init__(
         self,
         observer_type: CodedConcept,
@@ -702,41 +721,30 @@ class ObserverContext(Template):
 
         """  # noqa
         super().__init__()
+        content: List[ContentItem] = []
         observer_type_item = CodeContentItem(
-            name=CodedConcept(
-                value='121005',
-                meaning='Observer Type',
-                scheme_designator='DCM',
-            ),
+            name=_OBSERVER_TYPE,
             value=observer_type,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(observer_type_item)
-        if observer_type == codes.cid270.Person:
-            if not isinstance(observer_identifying_attributes,
-                              PersonObserverIdentifyingAttributes):
-                raise TypeError(
-                    'Observer identifying attributes must have '
-                    'type {} for observer type "{}".'.format(
-                        PersonObserverIdentifyingAttributes.__name__,
-                        observer_type.meaning
-                    )
-                )
-        elif observer_type == codes.cid270.Device:
-            if not isinstance(observer_identifying_attributes,
-                              DeviceObserverIdentifyingAttributes):
-                raise TypeError(
-                    'Observer identifying attributes must have '
-                    'type {} for observer type "{}".'.format(
-                        DeviceObserverIdentifyingAttributes.__name__,
-                        observer_type.meaning,
-                    )
-                )
-        else:
+        content.append(observer_type_item)
+        expected_type = self._IDENTIFYING_ATTRIBUTES_TYPES.get(
+            (observer_type.value, observer_type.scheme_designator)
+        )
+        if expected_type is None:
             raise ValueError(
                 'Argument "oberver_type" must be either "Person" or "Device".'
             )
-        self.extend(observer_identifying_attributes)
+        if not isinstance(observer_identifying_attributes, expected_type):
+            raise TypeError(
+                'Observer identifying attributes must have '
+                'type {} for observer type "{}".'.format(
+                    expected_type.__name__,
+                    observer_type.meaning
+                )
+            )
+        content.extend(observer_identifying_attributes)
+        self.extend(content)
 
 
 class SubjectContextFetus(Template):
@@ -754,13 +762,9 @@ class SubjectContextFetus(Template):
         """
         super().__init__()
         subject_id_item = TextContentItem(
-            name=CodedConcept(
-                value='121030',
-                meaning='Subject ID',
-                scheme_designator='DCM'
-            ),
+            name=_SUBJECT_ID,
             value=subject_id,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
         self.append(subject_id_item)
 
@@ -795,49 +799,35 @@ class SubjectContextSpecimen(Template):
 
         """  # noqa: E501
         super().__init__()
+        content: List[ContentItem] = []
         specimen_uid_item = UIDRefContentItem(
-            name=CodedConcept(
-                value='121039',
-                meaning='Specimen UID',
-                scheme_designator='DCM'
-            ),
+            name=_SPECIMEN_UID,
             value=uid,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(specimen_uid_item)
+        content.append(specimen_uid_item)
         if identifier is not None:
             specimen_identifier_item = TextContentItem(
-                name=CodedConcept(
-                    value='121041',
-                    meaning='Specimen Identifier',
-                    scheme_designator='DCM'
-                ),
+                name=_SPECIMEN_IDENTIFIER,
                 value=identifier,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(specimen_identifier_item)
+            content.append(specimen_identifier_item)
         if container_identifier is not None:
             container_identifier_item = TextContentItem(
-                name=CodedConcept(
-                    value='111700',
-                    meaning='Specimen Container Identifier',
-                    scheme_designator='DCM'
-                ),
+                name=_SPECIMEN_CONTAINER_IDENTIFIER,
                 value=container_identifier,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(container_identifier_item)
+            content.append(container_identifier_item)
         if specimen_type is not None:
             specimen_type_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121042',
-                    meaning='Specimen Type',
-                    scheme_designator='DCM'
-                ),
+                name=_SPECIMEN_TYPE,
                 value=specimen_type,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(specimen_type_item)
+            content.append(specimen_type_item)
+        self.extend(content)
 
 
 class SubjectContextDevice(Template):
@@ -872,59 +862,49 @@ class SubjectContextDevice(Template):
 
         """
         super().__init__()
+        content: List[ContentItem] = []
         device_name_item = TextContentItem(
-            name=codes.DCM.DeviceSubjectName,
+            name=_DEVICE_SUBJECT_NAME,
             value=name,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(device_name_item)
+        content.append(device_name_item)
         if uid is not None:
             device_uid_item = UIDRefContentItem(
-                name=codes.DCM.DeviceSubjectUID,
+                name=_DEVICE_SUBJECT_UID,
                 value=uid,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(device_uid_item)
+            content.append(device_uid_item)
         if manufacturer_name is not None:
             manufacturer_name_item = TextContentItem(
-                name=CodedConcept(
-                    value='121194',
-                    meaning='Device Subject Manufacturer',
-                    scheme_designator='DCM',
-                ),
+                name=_DEVICE_SUBJECT_MANUFACTURER,
                 value=manufacturer_name,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(manufacturer_name_item)
+            content.append(manufacturer_name_item)
         if model_name is not None:
             model_name_item = TextContentItem(
-                name=CodedConcept(
-                    value='121195',
-                    meaning='Device Subject Model Name',
-                    scheme_designator='DCM',
-                ),
+                name=_DEVICE_SUBJECT_MODEL_NAME,
                 value=model_name,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(model_name_item)
+            content.append(model_name_item)
         if serial_number is not None:
             serial_number_item = TextContentItem(
-                name=CodedConcept(
-                    value='121196',
-                    meaning='Device Subject Serial Number',
-                    scheme_designator='DCM',
-                ),
+                name=_DEVICE_SUBJECT_SERIAL_NUMBER,
                 value=serial_number,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(serial_number_item)
+            content.append(serial_number_item)
         if physical_location is not None:
             physical_location_item = TextContentItem(
-                name=codes.DCM.DeviceSubjectPhysicalLocationDuringObservation,
+                name=_DEVICE_SUBJECT_PHYSICAL_LOCATION,
                 value=physical_location,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            self.append(physical_location_item)
+            content.append(physical_location_item)
+        self.extend(content)
 
 
 class SubjectContext(Template):
@@ -955,18 +935,16 @@ class SubjectContext(Template):
 
         """  # noqa
         super().__init__()
+        content: List[ContentItem] = []
         subject_class_item = CodeContentItem(
-            name=CodedConcept(
-                value='121024',
-                meaning='Subject Class',
-                scheme_designator='DCM'
-            ),
+            name=_SUBJECT_CLASS,
             value=subject_class,
-            relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            relationship_type=_HAS_OBS_CONTEXT
         )
-        self.append(subject_class_item)
+        content.append(subject_class_item)
         if subject_class_specific_context is not None:
-            self.extend(subject_class_specific_context)
+            content.extend(subject_class_specific_context)
+        self.extend(content)
 
 
 class ObservationContext(Template):
@@ -1039,11 +1017,7 @@ class LanguageOfContentItemAndDescendants(Template):
         """
         super().__init__()
         language_item = CodeContentItem(
-            name=CodedConcept(
-                value='121049',
-                meaning='Language of Content Item and Descendants',
-                scheme_designator='DCM',
-            ),
+            name=_LANGUAGE_OF_CONTENT,
             value=language,
             relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
         )
@@ -1123,64 +1097,57 @@ class Measurement(Template):
             qualifier=qualifier,
             relationship_type=RelationshipTypeValues.CONTAINS
         )
-        value_item.ContentSequence = ContentSequence()
+        content: List[ContentItem] = []
         if tracking_identifier is not None:
             if not isinstance(tracking_identifier, TrackingIdentifier):
                 raise TypeError(
                     'Argument "tracking_identifier" must have type '
                     'TrackingIdentifier.'
                 )
-            value_item.ContentSequence.extend(tracking_identifier)
+            content.extend(tracking_identifier)
         if method is not None:
             method_item = CodeContentItem(
-                name=CodedConcept(
-                    value='370129005',
-                    meaning='Measurement Method',
-                    scheme_designator='SCT'
-                ),
+                name=_MEASUREMENT_METHOD,
                 value=method,
                 relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
             )
-            value_item.ContentSequence.append(method_item)
+            content.append(method_item)
         if derivation is not None:
             derivation_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121401',
-                    meaning='Derivation',
-                    scheme_designator='DCM'
-                ),
+                name=_DERIVATION,
                 value=derivation,
                 relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
             )
-            value_item.ContentSequence.append(derivation_item)
+            content.append(derivation_item)
         if finding_sites is not None:
-            if not isinstance(finding_sites, (list, tuple, set)):
+            try:
+                finding_sites = tuple(finding_sites)
+            except TypeError:
                 raise TypeError(
                     'Argument "finding_sites" must be a sequence.'
-
                 )
-            for site in finding_sites:
-                if not isinstance(site, FindingSite):
-                    raise TypeError(
-                        'Items of argument "finding_sites" must have '
-                        'type FindingSite.'
-                    )
-                value_item.ContentSequence.append(site)
+            if not all(isinstance(site, FindingSite) for site in finding_sites):
+                raise TypeError(
+                    'Items of argument "finding_sites" must have '
+                    'type FindingSite.'
+                )
+            content.extend(finding_sites)
         if properties is not None:
             if not isinstance(properties, MeasurementProperties):
                 raise TypeError(
                     'Argument "properties" must have '
                     'type MeasurementProperties.'
                 )
-            value_item.ContentSequence.extend(properties)
+            content.extend(properties)
         if referenced_images is not None:
-            for image in referenced_images:
-                if not isinstance(image, SourceImageForMeasurement):
-                    raise TypeError(
-                        'Arguments "referenced_images" must have type '
-                        'SourceImageForMeasurement.'
-                    )
-                value_item.ContentSequence.append(image)
+            referenced_images = tuple(referenced_images)
+            if not all(isinstance(image, SourceImageForMeasurement)
+                       for image in referenced_images):
+                raise TypeError(
+                    'Arguments "referenced_images" must have type '
+                    'SourceImageForMeasurement.'
+                )
+            content.extend(referenced_images)
         if referenced_real_world_value_map is not None:
             if not isinstance(referenced_real_world_value_map,
                               RealWorldValueMap):
@@ -1188,14 +1155,15 @@ class Measurement(Template):
                     'Argument "referenced_real_world_value_map" must have type '
                     'RealWorldValueMap.'
                 )
-            value_item.ContentSequence.append(referenced_real_world_value_map)
+            content.append(referenced_real_world_value_map)
         if algorithm_id is not None:
             if not isinstance(algorithm_id, AlgorithmIdentification):
                 raise TypeError(
                     'Argument "algorithm_id" must have type '
                     'AlgorithmIdentification.'
                 )
-            value_item.ContentSequence.extend(algorithm_id)
+            content.extend(algorithm_id)
+        value_item.ContentSequence = content
         self.append(value_item)
 
 
@@ -1248,14 +1216,10 @@ class MeasurementsAndQualitativeEvaluations(Template):
         """  # noqa
         super().__init__()
         group_item = ContainerContentItem(
-            name=CodedConcept(
-                value='125007',
-                meaning='Measurement Group',
-                scheme_designator='DCM'
-            ),
+            name=_MEASUREMENT_GROUP,
             relationship_type=RelationshipTypeValues.CONTAINS
         )
-        group_item.ContentSequence = ContentSequence()
+        content: List[ContentItem] = []
         if not isinstance(tracking_identifier, TrackingIdentifier):
             raise TypeError(
                 'Argument "tracking_identifier" must have type '
@@ -1267,67 +1231,55 @@ class MeasurementsAndQualitativeEvaluations(Template):
                 'human readable tracking identifier and a tracking unique '
                 'identifier.'
             )
-        group_item.ContentSequence.extend(tracking_identifier)
+        content.extend(tracking_identifier)
         if session is not None:
             session_item = TextContentItem(
-                name=CodedConcept(
-                    value='C67447',
-                    meaning='Activity Session',
-                    scheme_designator='NCIt'
-                ),
+                name=_ACTIVITY_SESSION,
                 value=session,
-                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                relationship_type=_HAS_OBS_CONTEXT
             )
-            group_item.ContentSequence.append(session_item)
+            content.append(session_item)
         if finding_type is not None:
             finding_type_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121071',
-                    meaning='Finding',
-                    scheme_designator='DCM'
-                ),
+                name=_FINDING,
                 value=finding_type,
                 relationship_type=RelationshipTypeValues.CONTAINS
             )
-            group_item.ContentSequence.append(finding_type_item)
+            content.append(finding_type_item)
         if method is not None:
             method_item = CodeContentItem(
-                name=CodedConcept(
-                    value='370129005',
-                    meaning='Measurement Method',
-                    scheme_designator='SCT'
-                ),
+                name=_MEASUREMENT_METHOD,
                 value=method,
                 relationship_type=RelationshipTypeValues.CONTAINS
             )
-            group_item.ContentSequence.append(method_item)
+            content.append(method_item)
         if finding_sites is not None:
-            if not isinstance(finding_sites, (list, tuple, set)):
+            try:
+                finding_sites = tuple(finding_sites)
+            except TypeError:
                 raise TypeError(
                     'Argument "finding_sites" must be a sequence.'
-
                 )
-            for site in finding_sites:
-                if not isinstance(site, FindingSite):
-                    raise TypeError(
-                        'Items of argument "finding_sites" must have '
-                        'type FindingSite.'
-                    )
-                group_item.ContentSequence.append(site)
+            if not all(isinstance(site, FindingSite) for site in finding_sites):
+                raise TypeError(
+                    'Items of argument "finding_sites" must have '
+                    'type FindingSite.'
+                )
+            content.extend(finding_sites)
         if algorithm_id is not None:
             if not isinstance(algorithm_id, AlgorithmIdentification):
                 raise TypeError(
                     'Argument "algorithm_id" must have type '
                     'AlgorithmIdentification.'
                 )
-            group_item.ContentSequence.extend(algorithm_id)
+            content.extend(algorithm_id)
         if time_point_context is not None:
             if not isinstance(time_point_context, TimePointContext):
                 raise TypeError(
                     'Argument "time_point_context" must have type '
                     'TimePointContext.'
                 )
-            group_item.ContentSequence.append(time_point_context)
+            content.extend(time_point_context)
         if referenced_real_world_value_map is not None:
             if not isinstance(referenced_real_world_value_map,
                               RealWorldValueMap):
@@ -1335,7 +1287,7 @@ class MeasurementsAndQualitativeEvaluations(Template):
                     'Argument "referenced_real_world_value_map" must have type '
                     'RealWorldValueMap.'
                 )
-            group_item.ContentSequence.append(referenced_real_world_value_map)
+            content.append(referenced_real_world_value_map)
         if measurements is not None:
             for measurement in measurements:
                 if not isinstance(measurement, Measurement):
@@ -1343,7 +1295,7 @@ class MeasurementsAndQualitativeEvaluations(Template):
                         'Items of argument "measurements" must have '
                         'type Measurement.'
                     )
-                group_item.ContentSequence.extend(measurement)
+                content.extend(measurement)
         if qualitative_evaluations is not None:
             for evaluation in qualitative_evaluations:
                 if not isinstance(evaluation, CodeContentItem):
@@ -1351,7 +1303,8 @@ class MeasurementsAndQualitativeEvaluations(Template):
                         'Items of argument "qualitative_evaluations" must have '
                         'type CodeContentItem.'
                     )
-                group_item.ContentSequence.append(evaluation)
+                content.append(evaluation)
+        group_item.ContentSequence = content
         self.append(group_item)
 
 
@@ -1441,18 +1394,18 @@ class _ROIMeasurementsAndQualitativeEvaluations(
             qualitative_evaluations=qualitative_evaluations
         )
         group_item = self[0]
-        were_references_provided = [
-            referenced_regions is not None,
-            referenced_volume_surface is not None,
-            referenced_segment is not None,
-        ]
-        if sum(were_references_provided) == 0:
+        num_references = (
+            (referenced_regions is not None) +
+            (referenced_volume_surface is not None) +
+            (referenced_segment is not None)
+        )
+        if num_references == 0:
             raise ValueError(
                 'One of the following arguments must be provided: '
                 '"referenced_regions", "referenced_volume_surface", or '
                 '"referenced_segment".'
             )
-        elif sum(were_references_provided) > 1:
+        elif num_references > 1:
             raise ValueError(
                 'Only one of the following arguments should be provided: '
                 '"referenced_regions", "referenced_volume_surface", or '
@@ -1460,11 +1413,7 @@ class _ROIMeasurementsAndQualitativeEvaluations(
             )
         if geometric_purpose is not None:
             geometric_purpose_item = CodeContentItem(
-                name=CodedConcept(
-                    value='130400',
-                    meaning='Geometric purpose of region',
-                    scheme_designator='DCM',
-                ),
+                name=_GEOMETRIC_PURPOSE_OF_REGION,
                 value=geometric_purpose,
                 relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
             )
@@ -1571,16 +1520,16 @@ class PlanarROIMeasurementsAndQualitativeEvaluations(
         segmentation or region was obtained.
 
         """  # noqa
-        were_references_provided = [
-            referenced_region is not None,
-            referenced_segment is not None,
-        ]
-        if sum(were_references_provided) == 0:
+        num_references = (
+            (referenced_region is not None) +
+            (referenced_segment is not None)
+        )
+        if num_references == 0:
             raise ValueError(
                 'One of the following arguments must be provided: '
                 '"referenced_region", "referenced_segment".'
             )
-        elif sum(were_references_provided) > 1:
+        elif num_references > 1:
             raise ValueError(
                 'Only one of the following arguments should be provided: '
                 '"referenced_region", "referenced_segment".'
@@ -1698,6 +1647,11 @@ class MeasurementsDerivedFromMultipleROIMeasurements(Template):
 
     """TID 1420 Measurements Derived From Multiple ROI Measurements"""
 
+    _GROUP_TYPES = (
+        PlanarROIMeasurementsAndQualitativeEvaluations,
+        VolumetricROIMeasurementsAndQualitativeEvaluations,
+    )
+
     def __init__(
             self,
             derivation: CodedConcept,
@@ -1730,27 +1684,27 @@ class MeasurementsDerivedFromMultipleROIMeasurements(Template):
             name=derivation,
             relationship_type=RelationshipTypeValues.CONTAINS
         )
-        value_item.ContentSequence = ContentSequence()
-        for group in measurement_groups:
-            allowed_group_types = (
-                PlanarROIMeasurementsAndQualitativeEvaluations,
-                VolumetricROIMeasurementsAndQualitativeEvaluations,
+        measurement_groups = list(measurement_groups)
+        if not all(isinstance(group, self._GROUP_TYPES)
+                   for group in measurement_groups):
+            raise TypeError(
+                'Items of argument "measurement_groups" must have type '
+                'PlanarROIMeasurementsAndQualitativeEvaluations or '
+                'VolumetricROIMeasurementsAndQualitativeEvaluations.'
             )
-            if not isinstance(group, allowed_group_types):
-                raise TypeError(
-                    'Items of argument "measurement_groups" must have type '
-                    'PlanarROIMeasurementsAndQualitativeEvaluations or '
-                    'VolumetricROIMeasurementsAndQualitativeEvaluations.'
-                )
+        for group in measurement_groups:
             group[0].RelationshipType = 'R-INFERRED FROM'
-            value_item.ContentSequence.extend(group)
+        content: List[ContentItem] = list(
+            itertools.chain.from_iterable(measurement_groups)
+        )
         if measurement_properties is not None:
             if not isinstance(measurement_properties, MeasurementProperties):
                 raise TypeError(
                     'Argument "measurement_properties" must have '
                     'type MeasurementProperties.'
                 )
-            value_item.ContentSequence.extend(measurement_properties)
+            content.extend(measurement_properties)
+        value_item.ContentSequence = content
         # TODO: how to do R-INFERRED FROM relationship?
         self.append(value_item)
 
@@ -1759,6 +1713,21 @@ class MeasurementReport(Template):
 
     """TID 1500 Measurement Report"""
 
+    _MEASUREMENT_TYPES = (
+        PlanarROIMeasurementsAndQualitativeEvaluations,
+        VolumetricROIMeasurementsAndQualitativeEvaluations,
+        MeasurementsAndQualitativeEvaluations,
+    )
+    _DERIVED_MEASUREMENT_TYPES = (
+        MeasurementsDerivedFromMultipleROIMeasurements,
+    )
+    _MEASUREMENT_TYPES_NAMES = '", "'.join(
+        t.__name__ for t in _MEASUREMENT_TYPES
+    )
+    _DERIVED_MEASUREMENT_TYPES_NAMES = '", "'.join(
+        t.__name__ for t in _DERIVED_MEASUREMENT_TYPES
+    )
+
     def __init__(
             self,
             observation_context: ObservationContext,
@@ -1813,7 +1782,7 @@ class MeasurementReport(Template):
         """ # noqa
         super().__init__()
         if title is None:
-            title = codes.cid7021.ImagingMeasurementReport
+            title = _IMAGING_MEASUREMENT_REPORT
         if not isinstance(title, (CodedConcept, Code, )):
             raise TypeError(
                 'Argument "title" must have type CodedConcept or Code.'
@@ -1822,101 +1791,62 @@ class MeasurementReport(Template):
             name=title,
             template_id='1500'
         )
-        item.ContentSequence = ContentSequence()
+        content: List[ContentItem] = []
         if language_of_content_item_and_descendants is None:
             language_of_content_item_and_descendants = \
                 LanguageOfContentItemAndDescendants(DEFAULT_LANGUAGE)
-        item.ContentSequence.extend(
-            language_of_content_item_and_descendants
-        )
-        item.ContentSequence.extend(observation_context)
+        content.extend(language_of_content_item_and_descendants)
+        content.extend(observation_context)
         if isinstance(procedure_reported, (CodedConcept, Code, )):
             procedure_reported = [procedure_reported]
         for procedure in procedure_reported:
             procedure_item = CodeContentItem(
-                name=CodedConcept(
-                    value='121058',
-                    meaning='Procedure reported',
-                    scheme_designator='DCM',
-                ),
+                name=_PROCEDURE_REPORTED,
                 value=procedure,
                 relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
             )
-            item.ContentSequence.append(procedure_item)
+            content.append(procedure_item)
         image_library_item = ImageLibrary()
-        item.ContentSequence.extend(image_library_item)
+        content.extend(image_library_item)
 
-        num_arguments_provided = sum([
-            imaging_measurements is not None,
-            derived_imaging_measurements is not None
-        ])
-        if num_arguments_provided > 1:
+        if (imaging_measurements is not None and
+                derived_imaging_measurements is not None):
             raise ValueError(
                 'Only one of the following arguments can be provided: '
                 '"imaging_measurements", "derived_imaging_measurement".'
             )
+        measurement_groups: Sequence[Template]
+        group_types: Tuple[type, ...]
         if imaging_measurements is not None:
-            measurement_types = (
-                PlanarROIMeasurementsAndQualitativeEvaluations,
-                VolumetricROIMeasurementsAndQualitativeEvaluations,
-                MeasurementsAndQualitativeEvaluations,
-            )
-            container_item = ContainerContentItem(
-                name=CodedConcept(
-                    value='126010',
-                    meaning='Imaging Measurements',
-                    scheme_designator='DCM'
-                ),
-                relationship_type=RelationshipTypeValues.CONTAINS
-            )
-            container_item.ContentSequence = []
-            for measurements in imaging_measurements:
-                if not isinstance(measurements, measurement_types):
-                    raise TypeError(
-                        'Measurements must have one of the following types: '
-                        '"{}"'.format(
-                            '", "'.join(
-                                [
-                                    t.__name__
-                                    for t in measurement_types
-                                ]
-                            )
-                        )
-                    )
-                container_item.ContentSequence.extend(measurements)
+            container_name = _IMAGING_MEASUREMENTS
+            measurement_groups = imaging_measurements
+            group_types = self._MEASUREMENT_TYPES
+            group_type_names = self._MEASUREMENT_TYPES_NAMES
         elif derived_imaging_measurements is not None:
-            derived_measurement_types = (
-                MeasurementsDerivedFromMultipleROIMeasurements,
-            )
-            container_item = ContainerContentItem(
-                name=CodedConcept(
-                    value='126011',
-                    meaning='Derived Imaging Measurements',
-                    scheme_designator='DCM'
-                ),
-                relationship_type=RelationshipTypeValues.CONTAINS
-            )
-            container_item.ContentSequence = []
-            for measurements in derived_imaging_measurements:
-                if not isinstance(measurements, derived_measurement_types):
-                    raise TypeError(
-                        'Measurements must have one of the following types: '
-                        '"{}"'.format(
-                            '", "'.join(
-                                [
-                                    t.__name__
-                                    for t in derived_measurement_types
-                                ]
-                            )
-                        )
-                    )
-                container_item.ContentSequence.extend(measurements)
+            container_name = _DERIVED_IMAGING_MEASUREMENTS
+            measurement_groups = derived_imaging_measurements
+            group_types = self._DERIVED_MEASUREMENT_TYPES
+            group_type_names = self._DERIVED_MEASUREMENT_TYPES_NAMES
         else:
             raise TypeError(
                 'One of the following arguments must be provided: '
                 '"imaging_measurements", "derived_imaging_measurements".'
             )
-        item.ContentSequence.append(container_item)
+        measurement_groups = list(measurement_groups)
+        if not all(isinstance(m, group_types) for m in measurement_groups):
+            raise TypeError(
+                'Measurements must have one of the following types: '
+                '"{}"'.format(group_type_names)
+            )
+        container_item = ContainerContentItem(
+            name=container_name,
+            relationship_type=RelationshipTypeValues.CONTAINS
+        )
+        container_item.ContentSequence = list(
+            itertools.chain.from_iterable(measurement_groups)
+        )
+        content.append(container_item)
+        item.ContentSequence = content
         self.append(item)
 
 
@@ -1934,11 +1864,7 @@ class ImageLibrary(Template):
         # We didn't implement this on purpose.
         super().__init__()
         library_item = ContainerContentItem(
-            name=CodedConcept(
-                value='111028',
-                meaning='Image Library',
-                scheme_designator='DCM'
-            ),
+            name=_IMAGE_LIBRARY,
             relationship_type=RelationshipTypeValues.CONTAINS
         )
         self.append(library_item)
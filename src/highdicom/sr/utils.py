@@ -1,23 +1,26 @@
 """Utilities for working with SR document instances."""
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 from pydicom.dataset import Dataset
 from pydicom.sr.coding import Code
 
 from highdicom.sr.coding import CodedConcept
 from highdicom.sr.enum import ValueTypeValues, RelationshipTypeValues
-from highdicom.sr.value_types import ContentItem
 
 
-def find_content_items(
+def iter_content_items(
     dataset: Dataset,
     name: Optional[Union[CodedConcept, Code]] = None,
     value_type: Optional[Union[ValueTypeValues, str]] = None,
     relationship_type: Optional[Union[RelationshipTypeValues, str]] = None,
     recursive: bool = False
-) -> List[Dataset]:
-    """Finds content items in a Structured Report document that match a given
-    query.
+) -> Iterator[Dataset]:
+    """Iterates over content items in a Structured Report document that match
+    a given query.
+
+    In contrast to :func:`highdicom.sr.utils.find_content_items`, matched
+    items are yielded lazily in depth-first order, such that the search can
+    be stopped as soon as the caller has found what it was looking for.
 
     Parameters
     ----------
@@ -37,39 +40,49 @@ def find_content_items(
 
     Returns
     -------
-    List[pydicom.dataset.Dataset]
-        flat list of all content items that matched the query
+    Iterator[pydicom.dataset.Dataset]
+        content items that matched the query
 
     Raises
     ------
     AttributeError
         When data set does not contain Content Sequence attribute.
+    ValueError
+        When value type or relationship type is not a valid enumerated value.
 
     """  # noqa
-    def has_name(item: ContentItem, name: Optional[str]) -> bool:
+    def has_name(
+            item: Dataset,
+            name: Optional[Union[CodedConcept, Code]]
+    ) -> bool:
         if name is None:
             return True
-        return item.name == name
+        name_code = item.ConceptNameCodeSequence[0]
+        item_name = Code(
+            value=name_code.CodeValue,
+            scheme_designator=name_code.CodingSchemeDesignator,
+            meaning=name_code.CodeMeaning
+        )
+        return item_name == name
 
     def has_value_type(
-            item: ContentItem,
-            value_type: Optional[Union[ValueTypeValues, str]]
+            item: Dataset,
+            value_type: Optional[str]
     ) -> bool:
         if value_type is None:
             return True
-        value_type = ValueTypeValues(value_type)
-        return item.value_type == value_type.value
+        return item.ValueType == value_type
 
     def has_relationship_type(
-            item: ContentItem,
-            relationship_type: Optional[Union[RelationshipTypeValues, str]]
+            item: Dataset,
+            relationship_type: Optional[str]
     ) -> bool:
         if relationship_type is None:
             return True
-        if getattr(item, 'relationship_type', None) is None:
+        item_relationship_type = item.get('RelationshipType', None)
+        if item_relationship_type is None:
             return False
-        relationship_type = RelationshipTypeValues(relationship_type)
-        return item.relationship_type == relationship_type.value
+        return item_relationship_type == relationship_type
 
     if not hasattr(dataset, 'ContentSequence'):
         raise AttributeError(
@@ -79,35 +92,29 @@ def find_content_items(
     def search_tree(
             node: Dataset,
             name: Optional[Union[CodedConcept, Code]],
-            value_type: Optional[Union[ValueTypeValues, str]],
-            relationship_type: Optional[Union[RelationshipTypeValues, str]],
+            value_type: Optional[str],
+            relationship_type: Optional[str],
             recursive: bool
-        ) -> List:
-        matched_content_items = []
-        for i, content_item in enumerate(node.ContentSequence):
-            name_code = content_item.ConceptNameCodeSequence[0]
-            item = ContentItem(
-                value_type=content_item.ValueType,
-                name=CodedConcept(
-                    value=name_code.CodeValue,
-                    scheme_designator=name_code.CodingSchemeDesignator,
-                    meaning=name_code.CodeMeaning
-                ),
-                relationship_type=content_item.get('RelationshipType', None)
-            )
-            if (has_name(item, name) and
-                    has_value_type(item, value_type) and
-                    has_relationship_type(item, relationship_type)):
-                matched_content_items.append(content_item)
+        ) -> Iterator[Dataset]:
+        for content_item in node.ContentSequence:
+            if (has_name(content_item, name) and
+                    has_value_type(content_item, value_type) and
+                    has_relationship_type(content_item, relationship_type)):
+                yield content_item
             if hasattr(content_item, 'ContentSequence') and recursive:
-                matched_content_items += search_tree(
+                yield from search_tree(
                     node=content_item,
                     name=name,
                     value_type=value_type,
                     relationship_type=relationship_type,
                     recursive=recursive
                 )
-        return matched_content_items
+
+    # Normalize the query once rather than for every visited content item
+    if value_type is not None:
+        value_type = ValueTypeValues(value_type).value
+    if relationship_type is not None:
+        relationship_type = RelationshipTypeValues(relationship_type).value
 
     return search_tree(
         node=dataset,
@@ -118,6 +125,54 @@ def find_content_items(
     )
 
 
+def find_content_items(
+    dataset: Dataset,
+    name: Optional[Union[CodedConcept, Code]] = None,
+    value_type: Optional[Union[ValueTypeValues, str]] = None,
+    relationship_type: Optional[Union[RelationshipTypeValues, str]] = None,
+    recursive: bool = False
+) -> List[Dataset]:
+    """Finds content items in a Structured Report document that match a given
+    query.
+
+    Parameters
+    ----------
+    dataset: pydicom.dataset.Dataset
+        SR document instance
+    name: Union[highdicom.sr.coding.CodedConcept, pydicom.sr.coding.Code], optional
+        Coded name that items should have
+    value_type: Union[highdicom.sr.enum.ValueTypeValues, str], optional
+        Type of value that items should have
+        (e.g. ``highdicom.sr.enum.ValueTypeValues.CONTAINER``)
+    relationship_type: Union[highdicom.sr.enum.RelationshipTypeValues, str], optional
+        Type of relationship that items should have with its parent
+        (e.g. ``highdicom.sr.enum.RelationshipTypeValues.CONTAINS``)
+    recursive: bool, optional
+        Whether search should be performed recursively, i.e. whether contained
+        child content items should also be queried
+
+    Returns
+    -------
+    List[pydicom.dataset.Dataset]
+        flat list of all content items that matched the query
+
+    Raises
+    ------
+    AttributeError
+        When data set does not contain Content Sequence attribute.
+
+    """  # noqa
+    return list(
+        iter_content_items(
+            dataset,
+            name=name,
+            value_type=value_type,
+            relationship_type=relationship_type,
+            recursive=recursive
+        )
+    )
+
+
 def get_coded_name(item: Dataset) -> CodedConcept:
     """Gets the concept name of a SR Content Item.
 
@@ -148,8 +148,14 @@ class ContentSequence(DataElementSequence):
             content items
 
         """
-        for i in items:
-            self.append(i)
+        items = list(items)
+        if not all(isinstance(i, ContentItem) for i in items):
+            raise TypeError(
+                'Items of "{}" must have type ContentItem.'.format(
+                    self.__class__.__name__
+                )
+            )
+        super(ContentSequence, self).extend(items)
 
     def insert(self, position: int, item: ContentItem) -> None:
         """Inserts a content item into the sequence at a given position.
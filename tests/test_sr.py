@@ -18,6 +18,7 @@ from highdicom.sr.content import (
     ImageRegion,
     ImageRegion3D,
     VolumeSurface,
+    SourceImageForMeasurement,
     SourceImageForRegion,
     SourceImageForSegmentation,
     RealWorldValueMap,
@@ -31,11 +32,12 @@ from highdicom.sr.enum import (
     RelationshipTypeValues,
     ValueTypeValues,
 )
-from highdicom.sr.utils import find_content_items
+from highdicom.sr.utils import find_content_items, iter_content_items
 from highdicom.sr.value_types import (
     CodeContentItem,
     ContainerContentItem,
     CompositeContentItem,
+    ContentSequence,
     DateContentItem,
     DateTimeContentItem,
     ImageContentItem,
@@ -66,6 +68,7 @@ from highdicom.sr.templates import (
     SubjectContext,
     SubjectContextSpecimen,
     SubjectContextDevice,
+    TimePointContext,
     TrackingIdentifier,
     VolumetricROIMeasurementsAndQualitativeEvaluations,
 )
@@ -111,6 +114,52 @@ class TestAlgorithmIdentification(unittest.TestCase):
             assert algo_id[i].TextValue == param
 
 
+class TestTimePointContext(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._time_point = 'Baseline'
+        self._time_point_order = 1
+
+    def test_construction_basic(self):
+        context = TimePointContext(time_point=self._time_point)
+        assert len(context) == 1
+        assert context[0].ConceptNameCodeSequence[0].CodeValue == 'C2348792'
+        assert context[0].TextValue == self._time_point
+
+    def test_construction_time_point_order(self):
+        context = TimePointContext(
+            time_point=self._time_point,
+            time_point_order=self._time_point_order
+        )
+        assert len(context) == 2
+        order_item = context[1]
+        assert order_item.ConceptNameCodeSequence[0].CodeValue == \
+            codes.DCM.TimePointOrder.value
+        measured_value = order_item.MeasuredValueSequence[0]
+        assert str(measured_value.NumericValue) == \
+            str(self._time_point_order)
+        unit = measured_value.MeasurementUnitsCodeSequence[0]
+        assert unit.CodeValue == '1'
+        assert unit.CodingSchemeDesignator == 'UCUM'
+
+    def test_construction_time_point_identifiers(self):
+        context = TimePointContext(
+            time_point=self._time_point,
+            subject_time_point_identifier='subject-1',
+            protocol_time_point_identifier='protocol-1'
+        )
+        assert len(context) == 3
+        subject_item = context[1]
+        assert subject_item.ValueType == 'TEXT'
+        assert subject_item.ConceptNameCodeSequence[0].CodeValue == '126070'
+        assert subject_item.TextValue == 'subject-1'
+        protocol_item = context[2]
+        assert protocol_item.ValueType == 'TEXT'
+        assert protocol_item.ConceptNameCodeSequence[0].CodeValue == '126071'
+        assert protocol_item.TextValue == 'protocol-1'
+
+
 class TestMeasurementStatisticalProperties(unittest.TestCase):
 
     def setUp(self):
@@ -660,6 +709,54 @@ class TestContentSequence(unittest.TestCase):
 
     def setUp(self):
         super().setUp()
+        self._items = [
+            TextContentItem(
+                name=codes.DCM.TrackingIdentifier,
+                value='lesion-{}'.format(i),
+                relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+            )
+            for i in range(3)
+        ]
+
+    def test_extend(self):
+        seq = ContentSequence()
+        seq.extend(self._items)
+        assert len(seq) == len(self._items)
+        for i, item in enumerate(self._items):
+            assert seq[i] is item
+
+    def test_extend_wrong_type(self):
+        seq = ContentSequence()
+        with pytest.raises(TypeError):
+            seq.extend(self._items + [Dataset()])
+        assert len(seq) == 0
+
+
+class TestDeviceObserverIdentifyingAttributes(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._uid = generate_uid()
+        self._name = 'Foo Device'
+        self._manufacturer_name = 'Foo Manufacturer'
+
+    def test_construction(self):
+        attributes = DeviceObserverIdentifyingAttributes(
+            uid=self._uid,
+            name=self._name,
+            manufacturer_name=self._manufacturer_name
+        )
+        assert len(attributes) == 3
+        uid_item = attributes[0]
+        assert uid_item.ConceptNameCodeSequence[0].CodeValue == '121012'
+        assert uid_item.UID == self._uid
+        name_item = attributes[1]
+        assert name_item.ConceptNameCodeSequence[0].CodeValue == '121013'
+        assert name_item.TextValue == self._name
+        manufacturer_name_item = attributes[2]
+        assert manufacturer_name_item.ConceptNameCodeSequence[0].CodeValue == \
+            '121014'
+        assert manufacturer_name_item.TextValue == self._manufacturer_name
 
 
 class TestSubjectContextDevice(unittest.TestCase):
@@ -759,6 +856,26 @@ class TestObservationContext(unittest.TestCase):
         assert item.ConceptNameCodeSequence[0].CodeValue == '121012'
         assert item.UID == self._device_uid
 
+    def test_observer_context_wrong_attributes_type(self):
+        attributes = PersonObserverIdentifyingAttributes(
+            name=self._person_name
+        )
+        with pytest.raises(TypeError):
+            ObserverContext(
+                observer_type=codes.cid270.Device,
+                observer_identifying_attributes=attributes
+            )
+
+    def test_observer_context_wrong_observer_type(self):
+        attributes = PersonObserverIdentifyingAttributes(
+            name=self._person_name
+        )
+        with pytest.raises(ValueError):
+            ObserverContext(
+                observer_type=codes.cid271.Specimen,
+                observer_identifying_attributes=attributes
+            )
+
     def test_subject_context(self):
         assert len(self._subject_context) == 2
         item = self._subject_context[0]
@@ -965,6 +1082,40 @@ class TestMeasurementOptional(unittest.TestCase):
         # Laterality and topological modifier were not specified
         assert len(item.ContentSequence) == 0
 
+    def test_finding_sites_iterable(self):
+        measurement = Measurement(
+            name=self._name,
+            value=self._value,
+            unit=self._unit,
+            finding_sites=(site for site in [self._finding_site])
+        )
+        item = measurement[0].ContentSequence[0]
+        assert item.ConceptNameCodeSequence[0].CodeValue == '363698007'
+
+    def test_referenced_images_iterable(self):
+        image = SourceImageForMeasurement(
+            referenced_sop_class_uid='1.2.840.10008.5.1.4.1.1.2.2',
+            referenced_sop_instance_uid=generate_uid()
+        )
+        measurement = Measurement(
+            name=self._name,
+            value=self._value,
+            unit=self._unit,
+            referenced_images=(i for i in [image])
+        )
+        assert len(measurement[0].ContentSequence) == 1
+        item = measurement[0].ContentSequence[0]
+        assert item.ValueType == 'IMAGE'
+
+    def test_finding_sites_not_iterable(self):
+        with pytest.raises(TypeError):
+            Measurement(
+                name=self._name,
+                value=self._value,
+                unit=self._unit,
+                finding_sites=1
+            )
+
 
 class TestImageRegion(unittest.TestCase):
 
@@ -1096,6 +1247,21 @@ class TestPlanarROIMeasurementsAndQualitativeEvaluations(unittest.TestCase):
             geometric_purpose=self._geometric_purpose
         )
 
+    def test_construction_with_time_point_context(self):
+        time_point_context = TimePointContext(time_point='Baseline')
+        template = PlanarROIMeasurementsAndQualitativeEvaluations(
+            tracking_identifier=self._tracking_identifier,
+            referenced_region=self._region,
+            time_point_context=time_point_context
+        )
+        group_item = template[0]
+        items = find_content_items(
+            group_item,
+            name=Code('C2348792', 'UMLS', 'Time Point')
+        )
+        assert len(items) == 1
+        assert items[0].TextValue == 'Baseline'
+
     def test_constructed_without_human_readable_tracking_identifier(self):
         tracking_identifier = TrackingIdentifier(
             uid=generate_uid()
@@ -1320,6 +1486,26 @@ class TestMeasurementReport(unittest.TestCase):
         subitem = item.ContentSequence[0]
         assert subitem.ConceptNameCodeSequence[0].CodeValue == '125007'
 
+    def test_imaging_measurements_wrong_type(self):
+        with pytest.raises(TypeError) as exc_info:
+            MeasurementReport(
+                observation_context=self._observation_context,
+                procedure_reported=self._procedure_reported,
+                imaging_measurements=[self._tracking_identifier]
+            )
+        message = str(exc_info.value)
+        assert 'PlanarROIMeasurementsAndQualitativeEvaluations' in message
+        assert '"MeasurementsAndQualitativeEvaluations"' in message
+
+    def test_imaging_measurements_iterable(self):
+        measurement_report = MeasurementReport(
+            observation_context=self._observation_context,
+            procedure_reported=self._procedure_reported,
+            imaging_measurements=(m for m in [self._measurements])
+        )
+        item = measurement_report[0].ContentSequence[7]
+        assert len(item.ContentSequence) == 1
+
 
 class TestEnhancedSR(unittest.TestCase):
 
@@ -1433,6 +1619,111 @@ class TestEnhancedSR(unittest.TestCase):
     def test_sop_class_uid(self):
         assert self._report.SOPClassUID == '1.2.840.10008.5.1.4.1.1.88.22'
 
+    def test_performed_procedure_codes(self):
+        assert self._report.PerformedProcedureCodeSequence == []
+        procedure_code = codes.LN.CTUnspecifiedBodyRegion
+        report = EnhancedSR(
+            evidence=[self._ref_dataset],
+            content=self._content,
+            series_instance_uid=self._series_instance_uid,
+            series_number=self._series_number,
+            sop_instance_uid=self._sop_instance_uid,
+            instance_number=self._instance_number,
+            performed_procedure_codes=[procedure_code]
+        )
+        assert len(report.PerformedProcedureCodeSequence) == 1
+        item = report.PerformedProcedureCodeSequence[0]
+        assert isinstance(item, CodedConcept)
+        assert item == procedure_code
+
+    def test_scoord3d_content(self):
+        content = ContainerContentItem(
+            name=codes.DCM.ImagingMeasurementReport
+        )
+        content.ContentSequence = [
+            ImageRegion3D(
+                graphic_type=GraphicTypeValues3D.POINT,
+                graphic_data=np.array([[1.0, 1.0, 1.0]]),
+                frame_of_reference_uid=generate_uid()
+            )
+        ]
+        with pytest.raises(ValueError) as exc_info:
+            EnhancedSR(
+                evidence=[self._ref_dataset],
+                content=content,
+                series_instance_uid=self._series_instance_uid,
+                series_number=self._series_number,
+                sop_instance_uid=self._sop_instance_uid,
+                instance_number=self._instance_number
+            )
+        assert 'SCOORD3D' in str(exc_info.value)
+
+    def _make_reference(self, series_instance_uid):
+        dataset = Dataset()
+        dataset.SOPClassUID = self._ref_dataset.SOPClassUID
+        dataset.SOPInstanceUID = generate_uid()
+        dataset.SeriesInstanceUID = series_instance_uid
+        dataset.StudyInstanceUID = self._ref_dataset.StudyInstanceUID
+        return dataset
+
+    def test_evidence_series_grouping(self):
+        other_series_instance_uid = generate_uid()
+        evidence = [
+            self._ref_dataset,
+            self._make_reference(other_series_instance_uid),
+            self._make_reference(self._ref_dataset.SeriesInstanceUID),
+        ]
+        report = EnhancedSR(
+            evidence=evidence,
+            content=self._content,
+            series_instance_uid=self._series_instance_uid,
+            series_number=self._series_number,
+            sop_instance_uid=self._sop_instance_uid,
+            instance_number=self._instance_number
+        )
+        study_item = report.PertinentOtherEvidenceSequence[0]
+        assert study_item.StudyInstanceUID == self._ref_dataset.StudyInstanceUID
+        series_items = study_item.ReferencedSeriesSequence
+        assert len(series_items) == 2
+        assert (
+            series_items[0].SeriesInstanceUID ==
+            self._ref_dataset.SeriesInstanceUID
+        )
+        assert len(series_items[0].ReferencedSOPSequence) == 2
+        assert (
+            series_items[0].ReferencedSOPSequence[1].ReferencedSOPInstanceUID ==
+            evidence[2].SOPInstanceUID
+        )
+        assert series_items[1].SeriesInstanceUID == other_series_instance_uid
+        assert len(series_items[1].ReferencedSOPSequence) == 1
+
+    def test_previous_versions_series_grouping(self):
+        series_instance_uid = generate_uid()
+        other_series_instance_uid = generate_uid()
+        previous_versions = [
+            self._make_reference(series_instance_uid),
+            self._make_reference(other_series_instance_uid),
+            self._make_reference(series_instance_uid),
+        ]
+        report = EnhancedSR(
+            evidence=[self._ref_dataset],
+            content=self._content,
+            series_instance_uid=self._series_instance_uid,
+            series_number=self._series_number,
+            sop_instance_uid=self._sop_instance_uid,
+            instance_number=self._instance_number,
+            previous_versions=previous_versions
+        )
+        assert len(report.PredecessorDocumentsSequence) == 1
+        study_item = report.PredecessorDocumentsSequence[0]
+        assert study_item.StudyInstanceUID == self._ref_dataset.StudyInstanceUID
+        series_items = study_item.ReferencedSeriesSequence
+        assert len(series_items) == 2
+        assert series_items[0].SeriesInstanceUID == series_instance_uid
+        assert len(series_items[0].ReferencedSOPSequence) == 2
+        assert series_items[1].SeriesInstanceUID == other_series_instance_uid
+        assert len(series_items[1].ReferencedSOPSequence) == 1
+
 
 class TestComprehensiveSR(unittest.TestCase):
 
@@ -1537,6 +1828,28 @@ class TestComprehensiveSR(unittest.TestCase):
     def test_sop_class_uid(self):
         assert self._report.SOPClassUID == '1.2.840.10008.5.1.4.1.1.88.33'
 
+    def test_scoord3d_content(self):
+        content = ContainerContentItem(
+            name=codes.DCM.ImagingMeasurementReport
+        )
+        content.ContentSequence = [
+            ImageRegion3D(
+                graphic_type=GraphicTypeValues3D.POINT,
+                graphic_data=np.array([[1.0, 1.0, 1.0]]),
+                frame_of_reference_uid=self._ref_dataset.FrameOfReferenceUID
+            )
+        ]
+        with pytest.raises(ValueError) as exc_info:
+            ComprehensiveSR(
+                evidence=[self._ref_dataset],
+                content=content,
+                series_instance_uid=self._series_instance_uid,
+                series_number=self._series_number,
+                sop_instance_uid=self._sop_instance_uid,
+                instance_number=self._instance_number
+            )
+        assert 'SCOORD3D' in str(exc_info.value)
+
 
 class TestComprehensive3DSR(unittest.TestCase):
 
@@ -1755,3 +2068,24 @@ class TestSRUtilities(unittest.TestCase):
             recursive=True
         )
         assert len(items) == 6
+
+    def test_iter_content_items(self):
+        items = iter_content_items(
+            self._sr_document,
+            value_type=ValueTypeValues.CODE,
+            recursive=True
+        )
+        assert not isinstance(items, list)
+        first_item = next(items)
+        name_code_value = first_item.ConceptNameCodeSequence[0].CodeValue
+        language_code = codes.DCM.LanguageOfContentItemAndDescendants
+        assert name_code_value == language_code.value
+        assert len(list(items)) == 8
+
+    def test_iter_content_items_without_content_sequence(self):
+        with pytest.raises(AttributeError):
+            iter_content_items(Dataset())
+
+    def test_iter_content_items_invalid_value_type(self):
+        with pytest.raises(ValueError):
+            iter_content_items(self._sr_document, value_type='FOO')